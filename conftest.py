@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures for the VCE Exam Player test suite.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Provide a single QApplication for every GUI test in the session."""
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
@@ -4,6 +4,7 @@ Interactive command-line interface for VCE Exam Player
 Provides a user-friendly way to take VCE exams with navigation and progress tracking.
 """
 
+import json
 import os
 import sys
 from typing import List, Optional
@@ -96,7 +97,6 @@ class ExamInterface:
                 session_id = session_file.stem
 
                 # Load session data
-                import json
                 with open(session_file, 'r') as f:
                     session_data = json.load(f)
 
@@ -114,7 +114,6 @@ class ExamInterface:
 
         for session_file in sessions:
             try:
-                import json
                 with open(session_file, 'r') as f:
                     data = json.load(f)
                 if data.get('status') == 'completed':
@@ -154,7 +153,6 @@ class ExamInterface:
         print("-" * 60)
         for session_file in sessions:
             try:
-                import json
                 with open(session_file, 'r') as f:
                     data = json.load(f)
 
@@ -3,6 +3,7 @@ VCE Exam Player - Interactive exam taking application
 Supports taking practice exams from VCE files with progress tracking and review.
 """
 
+import sys
 import time
 import json
 import random
@@ -79,9 +80,7 @@ class ExamPlayer:
         
         if randomize_questions:
             # Create a new random instance with high entropy for true randomness
-            import random as random_module
-            import os
-            session_random = random_module.Random()
+            session_random = random.Random()
             # Use multiple sources of entropy: current time, process ID, and OS random
             entropy_seed = int(time.time() * 1000000) + os.getpid() + int.from_bytes(os.urandom(4), 'big')
             session_random.seed(entropy_seed)
@@ -354,7 +353,6 @@ class ExamPlayer:
 
 def main():
     """Main function for command-line exam player."""
-    import sys
 
     if len(sys.argv) < 2:
         print("Usage: python exam_player.py <vce_file_path> [session_id]")
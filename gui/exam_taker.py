@@ -9,7 +9,7 @@ from typing import List, Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QRadioButton,
     QCheckBox, QButtonGroup, QPushButton, QTextEdit, QScrollArea,
-    QFrame, QMessageBox, QProgressBar, QSplitter, QTabWidget
+    QFrame, QMessageBox, QProgressBar, QSplitter, QTabWidget, QInputDialog
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QKeySequence, QShortcut
@@ -277,7 +277,6 @@ class ExamTakerWidget(QWidget):
 
     def on_time_warning(self, minutes_remaining: int):
         """Handle time warning."""
-        from PyQt6.QtWidgets import QMessageBox
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle("Time Warning")
         msg_box.setText(f"⏰ Only {minutes_remaining} minutes remaining!")
@@ -287,7 +286,6 @@ class ExamTakerWidget(QWidget):
 
     def on_time_expired(self):
         """Handle time expiration."""
-        from PyQt6.QtWidgets import QMessageBox
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle("Time Expired")
         msg_box.setText("⏰ Time has expired!")
@@ -507,7 +505,6 @@ class ExamTakerWidget(QWidget):
 
     def show_jump_dialog(self):
         """Show dialog to jump to a specific question."""
-        from PyQt6.QtWidgets import QInputDialog
         
         total_questions = len(self.player.question_order)
         
@@ -9,12 +9,13 @@ from typing import Optional
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFileDialog, QTextEdit, QProgressBar, QStatusBar, QMenuBar,
-    QMessageBox, QStackedWidget, QCheckBox
+    QMessageBox, QStackedWidget, QCheckBox, QSpinBox, QListWidget, QListWidgetItem
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QAction, QKeySequence, QIcon, QPixmap, QPainter, QColor
 
 import json
+import traceback
 from pathlib import Path
 
 # Import ExamPlayer only when needed to avoid initialization issues
@@ -22,6 +23,7 @@ from pathlib import Path
 from .exam_taker import ExamTakerWidget
 from .results_viewer import ResultsViewerWidget
 from .settings_dialog import SettingsDialog
+from .session_dialog import SessionSelectionDialog
 from .session_manager import SessionManager
 
 
@@ -59,7 +61,6 @@ class MainWindow(QMainWindow):
             print("✓ MainWindow initialized successfully")
         except Exception as e:
             print(f"✗ Error initializing MainWindow: {e}")
-            import traceback
             traceback.print_exc()
             raise
 
@@ -332,7 +333,6 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.randomize_checkbox)
 
         # Question limit option
-        from PyQt6.QtWidgets import QSpinBox
         limit_layout = QHBoxLayout()
         limit_label = QLabel("Number of questions:")
         limit_label.setStyleSheet("font-size: 14px; color: #EAE1D9; margin-left: 20px;")
@@ -550,7 +550,6 @@ class MainWindow(QMainWindow):
             return
         
         # Create session selection dialog
-        from .session_dialog import SessionSelectionDialog
         dialog = SessionSelectionDialog(resumable_sessions, "Resume Session", self)
         
         if dialog.exec():
@@ -571,7 +570,6 @@ class MainWindow(QMainWindow):
             return
         
         # Create session selection dialog
-        from .session_dialog import SessionSelectionDialog
         dialog = SessionSelectionDialog(completed_sessions, "Review Session", self)
         
         if dialog.exec():
@@ -665,8 +663,8 @@ class MainWindow(QMainWindow):
                         id=q_num,
                         type="single",
                         question_text=f"Question {q_num} (from completed session)",
-                        answers=["Answer A", "Answer B", "Answer C", "Answer D"],
-                        correct_answers=[0],  # Will be updated from session
+                        answers=("Answer A", "Answer B", "Answer C", "Answer D"),
+                        correct_answers=(0,),  # Will be updated from session
                         explanation="Review from completed session"
                     )
                     questions.append(question)
@@ -708,7 +706,6 @@ class MainWindow(QMainWindow):
         parent_layout.addWidget(recent_label)
 
         # Recent sessions list
-        from PyQt6.QtWidgets import QListWidget, QListWidgetItem
         self.recent_sessions_list = QListWidget()
         self.recent_sessions_list.setMaximumHeight(150)
         self.recent_sessions_list.setStyleSheet("""
@@ -744,13 +741,11 @@ class MainWindow(QMainWindow):
             self.recent_sessions_list.clear()
 
             if not recent_sessions:
-                from PyQt6.QtWidgets import QListWidgetItem
                 item = QListWidgetItem("No recent sessions found. Load a VCE file to start.")
                 item.setData(Qt.ItemDataRole.UserRole, None)
                 self.recent_sessions_list.addItem(item)
                 return
 
-            from PyQt6.QtWidgets import QListWidgetItem
             for session in recent_sessions:
                 # Format session display
                 exam_title = session.get('exam_title', 'Unknown Exam')[:40]
@@ -3,18 +3,22 @@ Results Viewer Widget for VCE Exam Player GUI.
 Displays exam results and provides detailed review functionality.
 """
 
+import re
 from typing import Dict, List, Optional, cast
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QListWidget,
     QListWidgetItem, QTextEdit, QPushButton, QFrame, QScrollArea,
-    QMessageBox, QSplitter
+    QMessageBox, QSplitter, QFileDialog
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 
 from exam_player import ExamPlayer, ExamSession
 
+# Markdown link target in "[Get AI explanation](https://...)" explanations
+_EXPLANATION_URL_RE = re.compile(r'\((https://[^)]+)\)')
+
 
 class ResultsViewerWidget(QWidget):
     """Widget for viewing exam results and reviewing questions."""
@@ -360,8 +364,7 @@ Correct Answers: {correct_answers}/{answered_questions}
                     # Check if it's a Perplexity link
                     if question.explanation.startswith("[Get AI explanation]"):
                         # Extract the URL from markdown link format
-                        import re
-                        url_match = re.search(r'\((https://[^)]+)\)', question.explanation)
+                        url_match = _EXPLANATION_URL_RE.search(question.explanation)
                         if url_match:
                             url = url_match.group(1)
                             explanation_text = (
@@ -533,7 +536,6 @@ Correct Answers: {correct_answers}/{answered_questions}
 
     def export_results(self):
         """Export exam results to a file."""
-        from PyQt6.QtWidgets import QFileDialog
         
         if not self.player.current_session:
             QMessageBox.warning(self, "No Session", "No session data to export.")
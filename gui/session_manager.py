@@ -7,12 +7,13 @@ import json
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
+from dataclasses import asdict
 from datetime import datetime
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QMessageBox
 
-from exam_player import ExamPlayer, ExamSession
+from exam_player import ExamPlayer, ExamSession, UserAnswer
 
 
 class SessionManager(QObject):
@@ -172,13 +173,10 @@ class SessionManager(QObject):
     
     def _session_to_dict(self, session: ExamSession) -> Dict:
         """Convert ExamSession to dictionary for JSON serialization."""
-        from dataclasses import asdict
         return asdict(session)
     
     def _dict_to_session(self, data: Dict) -> ExamSession:
         """Convert dictionary to ExamSession object."""
-        from exam_player import UserAnswer
-        
         # Convert answers dict if present
         if 'answers' in data and data['answers']:
             converted_answers = {}
@@ -6,6 +6,7 @@ Main entry point for the graphical user interface version.
 
 import sys
 import os
+import traceback
 from pathlib import Path
 
 # Add current directory to path for imports
@@ -246,7 +247,6 @@ def main():
 
     except Exception as e:
         print(f"Error starting application: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
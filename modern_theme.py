@@ -3,45 +3,43 @@ Modern Theme for VCE Exam Player - Contemporary UI Design
 Qt-compatible modern styling with clean design and professional appearance.
 """
 
-from PyQt6.QtGui import QFont, QPalette, QColor
+import platform
+from functools import lru_cache
+from typing import Optional
+
+from PyQt6.QtGui import QFont, QFontDatabase, QPalette, QColor
 from PyQt6.QtWidgets import QApplication
 
 
-def apply_modern_theme(app: QApplication):
-    """Apply modern, contemporary theme to the application."""
-    
-    # Set modern font stack - prioritize system fonts by platform
-    import platform
-    from PyQt6.QtGui import QFontDatabase
-    
-    system = platform.system()
+def _find_font(font_names, available_families) -> Optional[QFont]:
+    """Find the first available font from a list."""
+    for font_name in font_names:
+        if font_name in available_families:
+            return QFont(font_name, 13)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _pick_font(system: str) -> QFont:
+    """Resolve the UI font for a platform, caching misses as well as hits."""
     font = None
     
-    # Get available font families for better matching
-    available_families = QFontDatabase.families()
-    
-    def find_font(font_names):
-        """Find the first available font from a list."""
-        for font_name in font_names:
-            if font_name in available_families:
-                test_font = QFont(font_name, 13)
-                if test_font.exactMatch() or font_name in available_families:
-                    return test_font
-        return None
+    # List the installed families once; each candidate is then a set lookup
+    available_families = frozenset(QFontDatabase.families())
     
     if system == "Darwin":  # macOS
         # Try macOS system fonts in order of preference
-        font = find_font(["Helvetica Neue", "SF Pro Text", "SF Pro Display", "Helvetica", "Lucida Grande"])
+        font = _find_font(["Helvetica Neue", "SF Pro Text", "SF Pro Display", "Helvetica", "Lucida Grande"], available_families)
     elif system == "Windows":  # Windows
         # Try Windows system fonts in order of preference
-        font = find_font(["Segoe UI", "Segoe UI Variable", "Tahoma", "Microsoft Sans Serif"])
+        font = _find_font(["Segoe UI", "Segoe UI Variable", "Tahoma", "Microsoft Sans Serif"], available_families)
     elif system == "Linux":  # Linux
         # Try Linux system fonts in order of preference
-        font = find_font(["Ubuntu", "Noto Sans", "DejaVu Sans", "Liberation Sans", "Cantarell"])
+        font = _find_font(["Ubuntu", "Noto Sans", "DejaVu Sans", "Liberation Sans", "Cantarell"], available_families)
     
     # Universal fallback if no system font found
     if not font:
-        font = find_font(["Arial", "Liberation Sans", "DejaVu Sans"])
+        font = _find_font(["Arial", "Liberation Sans", "DejaVu Sans"], available_families)
     
     # Final fallback - use Qt's default system font
     if not font:
@@ -52,6 +50,16 @@ def apply_modern_theme(app: QApplication):
     if font.pointSize() <= 0:
         font.setPointSize(13)
     
+    return font
+
+
+def apply_modern_theme(app: QApplication):
+    """Apply modern, contemporary theme to the application."""
+    
+    # Set modern font stack - prioritize system fonts by platform.
+    # The resolved font is cached, so reapplying the theme skips the font DB.
+    font = _pick_font(platform.system())
+    
     app.setFont(font)
     
     # Modern color palette - Dark theme with blue accent
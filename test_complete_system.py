@@ -4,9 +4,13 @@ Complete system test for the enhanced VCE Exam Player.
 Tests all major components and features.
 """
 
+import os
 import sys
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication
+
+# Render Qt offscreen so GUI tests run on headless machines without probing
+# for a display; PyQt6 itself is imported lazily (see the qapp fixture)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 
 def test_vce_parsing():
@@ -50,6 +54,61 @@ def test_vce_parsing():
     return results
 
 
+def test_question_ids():
+    """Test that questions repeated from a pool still get sequential IDs."""
+    print("\\n🔢 Testing Question IDs")
+    print("-" * 40)
+    
+    from vce_parser import create_file_specific_questions, iter_file_specific_questions, parse_vce_file
+    
+    # 206 questions drawn from a 20-question pool
+    az104_file = "vce/Microsoft.actualtests.AZ-104.v2025-02-16.by.ida.206q.vce"
+    exam = parse_vce_file(az104_file)
+    ids = [q.id for q in exam.questions]
+    assert ids == list(range(1, exam.total_questions + 1))
+    
+    # Parsing another file must not renumber questions already handed out
+    parse_vce_file("vce/Designing Microsoft Azure Infrastructure Solutions.AZ-305.Test4Prep.2025-02-22.35q.vce")
+    assert [q.id for q in exam.questions] == ids
+    
+    # Streaming the same file yields the same numbered questions
+    streamed = iter_file_specific_questions(exam.title, az104_file, exam.total_questions)
+    assert list(streamed) == exam.questions
+    
+    # Negative counts produce no questions from either entry point
+    assert create_file_specific_questions(exam.title, az104_file, -5) == []
+    assert list(iter_file_specific_questions(exam.title, az104_file, -5)) == []
+    
+    print(f"✅ {len(ids)} sequential question IDs")
+    return True
+
+
+def test_questions_for_files():
+    """Test that the batch API matches per-file question creation."""
+    print("\\n📚 Testing Batch Question Creation")
+    print("-" * 40)
+    
+    from vce_parser import create_file_specific_questions, create_questions_for_files, parse_vce_file
+    
+    files = [
+        "vce/Designing Microsoft Azure Infrastructure Solutions.AZ-305.Test4Prep.2025-02-22.35q.vce",
+        "vce/Microsoft.actualtests.AZ-104.v2025-02-16.by.ida.206q.vce",
+        "x/Azure Fundamentals.AZ-900.vce",
+    ]
+    questions_by_file = create_questions_for_files(files, 25)
+    for file_path in files:
+        title = parse_vce_file(file_path).title
+        assert questions_by_file[file_path] == create_file_specific_questions(title, file_path, 25)
+    
+    # Files sharing a pool and seed get equal questions but separate lists
+    shared = create_questions_for_files(["vce/Practice.Exam.A.vce", "vce/Practice.Exam.K.vce"], 25)
+    first, second = shared["vce/Practice.Exam.A.vce"], shared["vce/Practice.Exam.K.vce"]
+    assert first == second and first is not second
+    
+    print(f"✅ {len(questions_by_file)} files match per-file creation")
+    return True
+
+
 def test_exam_player():
     """Test the exam player functionality."""
     print("\\n🎯 Testing Exam Player System")
@@ -89,14 +148,12 @@ def test_exam_player():
         return False
 
 
-def test_gui_components():
+def test_gui_components(qapp):
     """Test GUI components."""
     print("\\n🖥️  Testing GUI Components")
     print("-" * 40)
     
     try:
-        app = QApplication(sys.argv)
-        
         # Test main window
         from gui.main_window import MainWindow
         window = MainWindow()
@@ -114,7 +171,6 @@ def test_gui_components():
         from gui.session_dialog import SessionSelectionDialog
         print("✅ Session dialog available")
         
-        app.quit()
         return True
         
     except Exception as e:
@@ -122,7 +178,24 @@ def test_gui_components():
         return False
 
 
-def test_session_management():
+def test_modern_theme(qapp):
+    """Test that the modern theme applies to a live application."""
+    print("\\n🎨 Testing Modern Theme")
+    print("-" * 40)
+    
+    from PyQt6.QtGui import QPalette
+    from modern_theme import apply_modern_theme
+    
+    apply_modern_theme(qapp)
+    assert qapp.font().pointSize() > 0
+    # Stylesheets read palette colours, so the accent must stay a solid colour
+    assert qapp.palette().color(QPalette.ColorRole.Highlight).name() == "#3b82f6"
+    
+    print(f"✅ Theme applied with font {qapp.font().family()}")
+    return True
+
+
+def test_session_management(qapp):
     """Test session management functionality."""
     print("\\n💾 Testing Session Management")
     print("-" * 40)
@@ -161,9 +234,14 @@ def main():
     
     # Test each component
     test_results.append(("VCE Parsing", test_vce_parsing()))
+    test_results.append(("Question IDs", test_question_ids()))
+    test_results.append(("Batch Questions", test_questions_for_files()))
     test_results.append(("Exam Player", test_exam_player()))
-    test_results.append(("GUI Components", test_gui_components()))
-    test_results.append(("Session Management", test_session_management()))
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+    test_results.append(("GUI Components", test_gui_components(app)))
+    test_results.append(("Modern Theme", test_modern_theme(app)))
+    test_results.append(("Session Management", test_session_management(app)))
     
     # Summary
     print("\\n📊 TEST SUMMARY")
@@ -3,29 +3,53 @@ VCE (Visual CertExam) file parser for exam simulation software.
 Fixed version with file-specific question variation.
 """
 
-import struct
+import logging
+import os
+import random
 import zlib
 import re
-import hashlib
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
+_log = logging.getLogger(__name__)
 
-@dataclass
+
+# Derive question variations from a checksum that is stable across processes;
+# set to False to use the (per-process salted) builtin hash() instead
+_STABLE_SEED = True
+
+# Number of distinct question orders a file can map to
+_VARIATION_COUNT = 10
+
+# Filename separators that become spaces in the exam title
+_TITLE_TRANS = str.maketrans({'.': ' ', '-': ' ', '_': ' '})
+
+# Filename question counts like "35q.vce", ".206q.", "_40q" in one pass
+_QCOUNT_RE = re.compile(r'(?:(\d+)q\.vcex?|\.(\d+)q\.|_(\d+)q)', re.IGNORECASE)
+
+# Answer letters by index (0 = 'A')
+_LETTERS = tuple(chr(65 + i) for i in range(26))
+
+
+@dataclass(frozen=True, slots=True)
 class Question:
-    """Represents a single exam question."""
+    """Represents a single exam question (immutable; shared by the question pools)."""
     id: int
     type: str  # 'single', 'multiple', 'drag_drop', etc.
     question_text: str
-    answers: List[str]
-    correct_answers: List[int]  # indices of correct answers
-    correct_answer_letters: Optional[str] = None  # e.g., "A", "A,B,C"
+    answers: Tuple[str, ...]
+    correct_answers: Tuple[int, ...]  # indices of correct answers
     explanation: Optional[str] = None
     image_path: Optional[str] = None
+    correct_answer_letters: str = field(init=False)  # e.g., "A", "A,B,C"; derived from correct_answers
 
+    def __post_init__(self):
+        object.__setattr__(self, 'correct_answer_letters', _format_correct_letters(tuple(self.correct_answers)))
 
-@dataclass
+
+@dataclass(slots=True)
 class Exam:
     """Represents a complete exam."""
     title: str
@@ -39,13 +63,29 @@ class Exam:
 
 
 def parse_vce_file(file_path: str) -> Exam:
-    """Main function to parse a VCE file."""
-    print(f"Parsing VCE file: {file_path}")
+    """Main function to parse a VCE file.
+
+    Results are cached per path, modification time and size; each caller gets
+    its own Exam (and question list) so session setup can adjust it freely.
+    """
+    try:
+        st = os.stat(file_path)
+        stamp: Optional[Tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    exam = _parse_vce_file_cached(file_path, stamp)
+    return replace(exam, questions=list(exam.questions))
+
+
+@lru_cache(maxsize=256)
+def _parse_vce_file_cached(file_path: str, stamp: Optional[Tuple[int, int]]) -> Exam:
+    """Parse a VCE file; ``stamp`` (mtime_ns, size) only participates in the cache key."""
+    _log.debug("Parsing VCE file: %s", file_path)
     
     # Generate file-specific questions based on filename and path
-    filename = Path(file_path).stem
-    title = filename.replace('.', ' ').replace('-', ' ').replace('_', ' ')
-    question_count = _extract_question_count_from_filename(file_path)
+    path = Path(file_path)
+    title = _title_for(path)
+    question_count = _extract_question_count_from_filename(path.name)
     questions = create_file_specific_questions(title, file_path, question_count or 25)
     
     return Exam(
@@ -60,28 +100,26 @@ def parse_vce_file(file_path: str) -> Exam:
     )
 
 
-def _format_correct_letters(correct_answers: List[int]) -> str:
-    """Convert correct answer indices to letter format."""
-    letters = [chr(65 + i) for i in correct_answers]  # 65 = 'A'
-    return ','.join(letters)
+def _title_for(path: Path) -> str:
+    """Derive the exam title from a file path (separators in the stem become spaces)."""
+    return path.stem.translate(_TITLE_TRANS)
 
 
-def _extract_question_count_from_filename(file_path: str) -> int:
-    """Extract expected question count from filename."""
-    filename = Path(file_path).name
-    
-    # Look for patterns like "35q", "206q", etc.
-    patterns = [
-        r'(\d+)q\.vce',
-        r'(\d+)q\.vcex',
-        r'\.(\d+)q\.',
-        r'_(\d+)q'
-    ]
+@lru_cache(maxsize=32)
+def _format_correct_letters(correct_answers: Tuple[int, ...]) -> str:
+    """Convert correct answer indices (as a hashable tuple) to letter format."""
+    return ','.join(map(_LETTERS.__getitem__, correct_answers))
+
+
+def _extract_question_count_from_filename(filename: str) -> int:
+    """Extract expected question count from a file name (no directory part)."""
+    # Every count form ends in "q"; skip the regex when no q is present at all
+    if 'q' not in filename and 'Q' not in filename:
+        return 0
     
-    for pattern in patterns:
-        match = re.search(pattern, filename, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
+    match = _QCOUNT_RE.search(filename)
+    if match:
+        return int(next(g for g in match.groups() if g))
     
     return 0
 
@@ -89,247 +127,269 @@ def _extract_question_count_from_filename(file_path: str) -> int:
 def create_file_specific_questions(title: str, file_path: str, expected_count: int) -> List[Question]:
     """Create different questions based on the file path hash."""
     
-    # Create a hash from the file path for consistent variation
-    file_hash = hashlib.md5(file_path.encode()).hexdigest()
-    variation_seed = int(file_hash[:8], 16) % 10  # 10 different question sets
+    variation_seed = _seed_for(file_path)
     
-    title_lower = title.lower()
+    # Determine exam type; files sharing pool, seed and count reuse one question set
+    final_questions = list(_build_questions(_questions_getter(title.lower()), variation_seed, expected_count))
     
-    # Determine exam type and create appropriate questions
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("Created %d questions for %s (variation %d)", len(final_questions), Path(file_path).name, variation_seed)
+    return final_questions
+
+
+def iter_file_specific_questions(title: str, file_path: str, expected_count: int) -> Iterator[Question]:
+    """Yield the questions create_file_specific_questions would return, one at a time."""
+    questions = _questions_getter(title.lower())(_seed_for(file_path))
+    pool_size = len(questions)
+    for i in range(max(expected_count, 0)):
+        yield replace(questions[i % pool_size], id=i + 1)
+
+
+def create_questions_for_files(files: Sequence[str], expected_count: int) -> Dict[str, List[Question]]:
+    """Create questions for many files at once; files sharing a pool and seed share one build."""
+    questions_by_file: Dict[str, List[Question]] = {}
+    for file_path in files:
+        getter = _questions_getter(_title_for(Path(file_path)).lower())
+        questions_by_file[file_path] = list(_build_questions(getter, _seed_for(file_path), expected_count))
+    return questions_by_file
+
+
+@lru_cache(maxsize=4096)
+def _seed_for(file_path: str) -> int:
+    """Hash the file path for consistent variation (one of _VARIATION_COUNT question sets)."""
+    if _STABLE_SEED:
+        return zlib.adler32(file_path.encode('utf-8')) % _VARIATION_COUNT
+    return hash(file_path) % _VARIATION_COUNT
+
+
+def _questions_getter(title_lower: str) -> Callable[[int], Tuple[Question, ...]]:
+    """Pick the question pool getter for an exam from its lowercased title."""
     if "az-305" in title_lower or ("azure" in title_lower and "infrastructure" in title_lower):
-        questions = _get_az305_questions(variation_seed)
+        return _get_az305_questions
     elif "az-104" in title_lower or "104" in title_lower:
-        questions = _get_az104_questions(variation_seed)
-    else:
-        questions = _get_general_azure_questions(variation_seed)
-    
-    # Extend questions if needed
-    final_questions = []
-    while len(final_questions) < expected_count:
-        final_questions.extend(questions)
+        return _get_az104_questions
+    return _get_general_azure_questions
+
+
+@lru_cache(maxsize=128)
+def _build_questions(getter: Callable[[int], Tuple[Question, ...]], variation_seed: int,
+                     expected_count: int) -> Tuple[Question, ...]:
+    """Build the numbered question set shared by every exam with the same pool, seed and count."""
+    questions = getter(variation_seed)
     
-    # Trim to exact count and assign proper IDs
-    final_questions = final_questions[:expected_count]
-    for i, q in enumerate(final_questions):
-        q.id = i + 1
+    # Repeat the pool up to the exact count in one allocation (negative counts give no questions)
+    repeats, remainder = divmod(max(expected_count, 0), len(questions))
+    final_questions = questions * repeats + questions[:remainder]
     
-    print(f"Created {len(final_questions)} questions for {Path(file_path).name} (variation {variation_seed})")
-    return final_questions
+    # Assign proper IDs without touching the shared pool
+    return tuple(replace(q, id=i + 1) for i, q in enumerate(final_questions))
+
+
+def _shuffled_pool(pool: Tuple[Question, ...], variation_seed: int) -> Tuple[Question, ...]:
+    """Shuffle a pool for one variation (seeded local RNG, global state untouched)."""
+    shuffled = list(pool)
+    random.Random(variation_seed).shuffle(shuffled)
+    return tuple(shuffled)
 
 
-def _get_az305_questions(variation_seed: int) -> List[Question]:
-    """Get AZ-305 specific questions based on variation."""
+# AZ-305 question pool, built once at import and shuffled per variation on demand
+_AZ305_POOL = (
+    # Infrastructure Design Questions
+    Question(1, "single", "What is the primary purpose of Azure Resource Manager templates?",
+            ("Deploy and manage Azure resources as a group", "Handle user authentication only", "Provide cloud storage solutions", "Manage virtual networks exclusively"),
+            (0,), "ARM templates provide infrastructure as code capabilities for consistent deployments."),
+    Question(2, "single", "Which Azure service provides managed Kubernetes orchestration?",
+            ("Azure Container Instances", "Azure Kubernetes Service (AKS)", "Azure Functions", "Azure Logic Apps"),
+            (1,), "AKS provides fully managed Kubernetes with automated updates and scaling."),
+    Question(3, "single", "What is Azure Load Balancer used for?",
+            ("Distribute traffic across multiple servers", "Store data in the cloud", "Manage user identities", "Run serverless functions"),
+            (0,), "Load Balancer distributes inbound traffic for high availability and performance."),
     
-    # Create a comprehensive question pool for AZ-305
-    all_questions = [
-        # Infrastructure Design Questions
-        Question(1, "single", "What is the primary purpose of Azure Resource Manager templates?",
-                ["Deploy and manage Azure resources as a group", "Handle user authentication only", "Provide cloud storage solutions", "Manage virtual networks exclusively"],
-                [0], "A", "ARM templates provide infrastructure as code capabilities for consistent deployments."),
-        Question(2, "single", "Which Azure service provides managed Kubernetes orchestration?",
-                ["Azure Container Instances", "Azure Kubernetes Service (AKS)", "Azure Functions", "Azure Logic Apps"],
-                [1], "B", "AKS provides fully managed Kubernetes with automated updates and scaling."),
-        Question(3, "single", "What is Azure Load Balancer used for?",
-                ["Distribute traffic across multiple servers", "Store data in the cloud", "Manage user identities", "Run serverless functions"],
-                [0], "A", "Load Balancer distributes inbound traffic for high availability and performance."),
-        
-        # Networking Solutions Questions
-        Question(4, "single", "Which Azure service provides private connectivity between Azure and on-premises?",
-                ["Azure VPN Gateway", "Azure Application Gateway", "Azure Front Door", "Azure Traffic Manager"],
-                [0], "A", "VPN Gateway provides secure cross-premises connectivity to Azure."),
-        Question(5, "multiple", "Which Azure networking services support SSL termination? (Select all that apply)",
-                ["Azure Application Gateway", "Azure Load Balancer", "Azure Front Door", "Azure Traffic Manager"],
-                [0, 2], "A,C", "Application Gateway and Front Door both support SSL termination capabilities."),
-        Question(6, "single", "What is Azure ExpressRoute used for?",
-                ["Public internet connectivity", "Private dedicated connectivity to Azure", "Content delivery network", "DNS resolution"],
-                [1], "B", "ExpressRoute provides private, dedicated connections to Azure datacenters."),
-        
-        # Security & Identity Questions
-        Question(7, "single", "What does Azure Active Directory provide?",
-                ["Virtual machine management", "Identity and access management", "Database administration", "Network monitoring"],
-                [1], "B", "Azure AD is Microsoft's cloud-based identity and access management service."),
-        Question(8, "single", "Which Azure service provides secrets management?",
-                ["Azure Storage", "Azure Key Vault", "Azure Monitor", "Azure Backup"],
-                [1], "B", "Key Vault securely stores and manages secrets, keys, and certificates."),
-        Question(9, "multiple", "Which authentication methods are supported by Azure AD? (Select all that apply)",
-                ["Multi-factor authentication", "Single sign-on (SSO)", "Conditional access", "Password-based authentication"],
-                [0, 1, 2, 3], "A,B,C,D", "Azure AD supports comprehensive authentication methods for security."),
-        
-        # Storage & Data Questions
-        Question(10, "multiple", "Which Azure storage types are available? (Select all that apply)",
-                ["Blob storage for unstructured data", "File storage for SMB shares", "Queue storage for messages", "Table storage for NoSQL data"],
-                [0, 1, 2, 3], "A,B,C,D", "Azure Storage provides multiple data services for different use cases."),
-        Question(11, "single", "What is Azure SQL Database?",
-                ["A NoSQL database service", "A managed relational database service", "A data warehouse solution", "A file storage service"],
-                [1], "B", "Azure SQL Database is a fully managed relational database service."),
-        Question(12, "single", "Which service provides big data analytics in Azure?",
-                ["Azure Storage", "Azure SQL Database", "Azure Synapse Analytics", "Azure Cosmos DB"],
-                [2], "C", "Synapse Analytics provides enterprise data warehousing and big data analytics."),
-        
-        # Compute & Applications Questions
-        Question(13, "single", "What is Azure App Service used for?",
-                ["Virtual machine management", "Web application hosting", "Database management", "Network configuration"],
-                [1], "B", "App Service provides a platform for hosting web applications and APIs."),
-        Question(14, "single", "Which Azure service provides serverless computing?",
-                ["Azure Virtual Machines", "Azure Container Instances", "Azure Functions", "Azure Kubernetes Service"],
-                [2], "C", "Azure Functions provides event-driven serverless computing."),
-        Question(15, "multiple", "Which Azure compute services support auto-scaling? (Select all that apply)",
-                ["Azure Virtual Machine Scale Sets", "Azure App Service", "Azure Functions", "Azure Container Instances"],
-                [0, 1, 2], "A,B,C", "These services provide automatic scaling based on demand."),
-        
-        # Monitoring & Management Questions
-        Question(16, "single", "What is Azure Monitor used for?",
-                ["Virtual machine management", "Application and infrastructure monitoring", "Identity management", "Database administration"],
-                [1], "B", "Azure Monitor collects and analyzes telemetry from cloud and on-premises environments."),
-        Question(17, "single", "Which Azure service provides content delivery network capabilities?",
-                ["Azure Traffic Manager", "Azure Front Door", "Azure CDN", "Azure Load Balancer"],
-                [2], "C", "Azure CDN provides global content delivery network capabilities."),
-        Question(18, "single", "What is Azure Policy used for?",
-                ["User authentication", "Resource compliance and governance", "Data storage", "Network configuration"],
-                [1], "B", "Azure Policy helps enforce organizational standards and assess compliance at scale."),
-        
-        # Advanced Infrastructure Questions
-        Question(19, "single", "What is the purpose of Azure Availability Zones?",
-                ["Cost optimization", "High availability and disaster recovery", "Performance enhancement", "Security isolation"],
-                [1], "B", "Availability Zones provide high availability by distributing resources across physically separate datacenters."),
-        Question(20, "single", "Which Azure service provides hybrid cloud connectivity?",
-                ["Azure VPN Gateway", "Azure ExpressRoute", "Azure Arc", "All of the above"],
-                [3], "D", "All these services provide different aspects of hybrid cloud connectivity.")
-    ]
+    # Networking Solutions Questions
+    Question(4, "single", "Which Azure service provides private connectivity between Azure and on-premises?",
+            ("Azure VPN Gateway", "Azure Application Gateway", "Azure Front Door", "Azure Traffic Manager"),
+            (0,), "VPN Gateway provides secure cross-premises connectivity to Azure."),
+    Question(5, "multiple", "Which Azure networking services support SSL termination? (Select all that apply)",
+            ("Azure Application Gateway", "Azure Load Balancer", "Azure Front Door", "Azure Traffic Manager"),
+            (0, 2), "Application Gateway and Front Door both support SSL termination capabilities."),
+    Question(6, "single", "What is Azure ExpressRoute used for?",
+            ("Public internet connectivity", "Private dedicated connectivity to Azure", "Content delivery network", "DNS resolution"),
+            (1,), "ExpressRoute provides private, dedicated connections to Azure datacenters."),
+    
+    # Security & Identity Questions
+    Question(7, "single", "What does Azure Active Directory provide?",
+            ("Virtual machine management", "Identity and access management", "Database administration", "Network monitoring"),
+            (1,), "Azure AD is Microsoft's cloud-based identity and access management service."),
+    Question(8, "single", "Which Azure service provides secrets management?",
+            ("Azure Storage", "Azure Key Vault", "Azure Monitor", "Azure Backup"),
+            (1,), "Key Vault securely stores and manages secrets, keys, and certificates."),
+    Question(9, "multiple", "Which authentication methods are supported by Azure AD? (Select all that apply)",
+            ("Multi-factor authentication", "Single sign-on (SSO)", "Conditional access", "Password-based authentication"),
+            (0, 1, 2, 3), "Azure AD supports comprehensive authentication methods for security."),
+    
+    # Storage & Data Questions
+    Question(10, "multiple", "Which Azure storage types are available? (Select all that apply)",
+            ("Blob storage for unstructured data", "File storage for SMB shares", "Queue storage for messages", "Table storage for NoSQL data"),
+            (0, 1, 2, 3), "Azure Storage provides multiple data services for different use cases."),
+    Question(11, "single", "What is Azure SQL Database?",
+            ("A NoSQL database service", "A managed relational database service", "A data warehouse solution", "A file storage service"),
+            (1,), "Azure SQL Database is a fully managed relational database service."),
+    Question(12, "single", "Which service provides big data analytics in Azure?",
+            ("Azure Storage", "Azure SQL Database", "Azure Synapse Analytics", "Azure Cosmos DB"),
+            (2,), "Synapse Analytics provides enterprise data warehousing and big data analytics."),
     
-    # Use variation seed to determine which questions to prioritize
-    import random
-    # Use local random instance to avoid affecting global state
-    local_random = random.Random(variation_seed)
+    # Compute & Applications Questions
+    Question(13, "single", "What is Azure App Service used for?",
+            ("Virtual machine management", "Web application hosting", "Database management", "Network configuration"),
+            (1,), "App Service provides a platform for hosting web applications and APIs."),
+    Question(14, "single", "Which Azure service provides serverless computing?",
+            ("Azure Virtual Machines", "Azure Container Instances", "Azure Functions", "Azure Kubernetes Service"),
+            (2,), "Azure Functions provides event-driven serverless computing."),
+    Question(15, "multiple", "Which Azure compute services support auto-scaling? (Select all that apply)",
+            ("Azure Virtual Machine Scale Sets", "Azure App Service", "Azure Functions", "Azure Container Instances"),
+            (0, 1, 2), "These services provide automatic scaling based on demand."),
     
-    # Shuffle the questions based on the seed for variation
-    shuffled_questions = all_questions.copy()
-    local_random.shuffle(shuffled_questions)
+    # Monitoring & Management Questions
+    Question(16, "single", "What is Azure Monitor used for?",
+            ("Virtual machine management", "Application and infrastructure monitoring", "Identity management", "Database administration"),
+            (1,), "Azure Monitor collects and analyzes telemetry from cloud and on-premises environments."),
+    Question(17, "single", "Which Azure service provides content delivery network capabilities?",
+            ("Azure Traffic Manager", "Azure Front Door", "Azure CDN", "Azure Load Balancer"),
+            (2,), "Azure CDN provides global content delivery network capabilities."),
+    Question(18, "single", "What is Azure Policy used for?",
+            ("User authentication", "Resource compliance and governance", "Data storage", "Network configuration"),
+            (1,), "Azure Policy helps enforce organizational standards and assess compliance at scale."),
     
-    return shuffled_questions
+    # Advanced Infrastructure Questions
+    Question(19, "single", "What is the purpose of Azure Availability Zones?",
+            ("Cost optimization", "High availability and disaster recovery", "Performance enhancement", "Security isolation"),
+            (1,), "Availability Zones provide high availability by distributing resources across physically separate datacenters."),
+    Question(20, "single", "Which Azure service provides hybrid cloud connectivity?",
+            ("Azure VPN Gateway", "Azure ExpressRoute", "Azure Arc", "All of the above"),
+            (3,), "All these services provide different aspects of hybrid cloud connectivity.")
+)
 
 
-def _get_az104_questions(variation_seed: int) -> List[Question]:
-    """Get AZ-104 specific questions based on variation."""
+@lru_cache(maxsize=_VARIATION_COUNT)
+def _get_az305_questions(variation_seed: int) -> Tuple[Question, ...]:
+    """Get AZ-305 specific questions based on variation (shuffled on first use)."""
+    return _shuffled_pool(_AZ305_POOL, variation_seed % _VARIATION_COUNT)
+
+
+# AZ-104 question pool, built once at import and shuffled per variation on demand
+_AZ104_POOL = (
+    # Virtual Machines Questions
+    Question(1, "single", "Which Azure service allows you to create and manage virtual machines?",
+            ("Azure Compute", "Azure Virtual Machines", "Azure Container Service", "Azure App Service"),
+            (1,), "Azure Virtual Machines provides on-demand, scalable computing resources."),
+    Question(2, "single", "What is the purpose of Azure Availability Sets?",
+            ("Provide high availability for VMs", "Manage storage accounts", "Configure network security", "Monitor application performance"),
+            (0,), "Availability Sets ensure VMs are distributed across fault and update domains."),
+    Question(3, "multiple", "Which VM sizes are available in Azure? (Select all that apply)",
+            ("General purpose (B, D series)", "Compute optimized (F series)", "Memory optimized (E, M series)", "Storage optimized (L series)"),
+            (0, 1, 2, 3), "Azure offers various VM sizes optimized for different workloads."),
     
-    # Create a comprehensive question pool for AZ-104
-    all_questions = [
-        # Virtual Machines Questions
-        Question(1, "single", "Which Azure service allows you to create and manage virtual machines?",
-                ["Azure Compute", "Azure Virtual Machines", "Azure Container Service", "Azure App Service"],
-                [1], "B", "Azure Virtual Machines provides on-demand, scalable computing resources."),
-        Question(2, "single", "What is the purpose of Azure Availability Sets?",
-                ["Provide high availability for VMs", "Manage storage accounts", "Configure network security", "Monitor application performance"],
-                [0], "A", "Availability Sets ensure VMs are distributed across fault and update domains."),
-        Question(3, "multiple", "Which VM sizes are available in Azure? (Select all that apply)",
-                ["General purpose (B, D series)", "Compute optimized (F series)", "Memory optimized (E, M series)", "Storage optimized (L series)"],
-                [0, 1, 2, 3], "A,B,C,D", "Azure offers various VM sizes optimized for different workloads."),
-        
-        # Storage Management Questions
-        Question(4, "single", "Which storage account type provides the lowest cost for infrequently accessed data?",
-                ["Premium SSD", "Standard HDD", "Cool storage tier", "Archive storage tier"],
-                [3], "D", "Archive tier offers the lowest storage costs for rarely accessed data."),
-        Question(5, "single", "What is Azure Disk Encryption used for?",
-                ["Network traffic encryption", "VM disk encryption at rest", "Database encryption", "Application-level encryption"],
-                [1], "B", "Azure Disk Encryption encrypts VM disks using BitLocker or DM-Crypt."),
-        Question(6, "multiple", "Which Azure storage replication options are available? (Select all that apply)",
-                ["Locally redundant storage (LRS)", "Zone-redundant storage (ZRS)", "Geo-redundant storage (GRS)", "Read-access geo-redundant storage (RA-GRS)"],
-                [0, 1, 2, 3], "A,B,C,D", "Azure provides multiple replication options for different durability needs."),
-        
-        # Identity & Access Questions
-        Question(7, "single", "What is Role-Based Access Control (RBAC) used for?",
-                ["Network traffic control", "Managing user permissions and access", "Data encryption", "Performance monitoring"],
-                [1], "B", "RBAC provides fine-grained access management for Azure resources."),
-        Question(8, "multiple", "Which built-in RBAC roles are commonly used? (Select all that apply)",
-                ["Owner", "Contributor", "Reader", "User Access Administrator"],
-                [0, 1, 2, 3], "A,B,C,D", "These are fundamental built-in roles for Azure resource management."),
-        Question(9, "single", "What is Azure AD Connect used for?",
-                ["Connecting to on-premises Active Directory", "Managing Azure subscriptions", "Configuring network connections", "Monitoring application performance"],
-                [0], "A", "Azure AD Connect synchronizes on-premises AD with Azure AD."),
-        
-        # Networking Questions
-        Question(10, "single", "What is the purpose of Network Security Groups (NSGs)?",
-                ["Load balancing traffic", "Filtering network traffic with security rules", "Managing DNS resolution", "Providing VPN connectivity"],
-                [1], "B", "NSGs contain security rules that allow or deny network traffic."),
-        Question(11, "single", "Which service provides name resolution for Azure resources?",
-                ["Azure Traffic Manager", "Azure DNS", "Azure Load Balancer", "Azure Application Gateway"],
-                [1], "B", "Azure DNS provides name resolution using Microsoft's global network."),
-        Question(12, "single", "What is VNet peering used for?",
-                ["Connecting VNets in the same or different regions", "Creating VPN connections", "Managing network security", "Load balancing traffic"],
-                [0], "A", "VNet peering connects virtual networks for resource communication."),
-        
-        # Monitoring & Backup Questions
-        Question(13, "single", "Which service provides monitoring and alerting for Azure resources?",
-                ["Azure Security Center", "Azure Monitor", "Azure Advisor", "Azure Policy"],
-                [1], "B", "Azure Monitor collects and analyzes telemetry from cloud and on-premises environments."),
-        Question(14, "single", "What is Azure Backup used for?",
-                ["Network security", "Data protection and recovery", "Performance optimization", "Cost management"],
-                [1], "B", "Azure Backup provides backup and restore capabilities for Azure resources."),
-        Question(15, "multiple", "Which Azure services can be backed up using Azure Backup? (Select all that apply)",
-                ["Azure Virtual Machines", "Azure SQL Database", "Azure Files", "On-premises servers"],
-                [0, 1, 2, 3], "A,B,C,D", "Azure Backup supports various Azure services and on-premises resources."),
-        
-        # Resource Management Questions
-        Question(16, "single", "What is Azure Resource Manager used for?",
-                ["Managing user identities", "Deploying and managing Azure resources", "Monitoring applications", "Configuring networks"],
-                [1], "B", "Azure Resource Manager provides a management layer for creating, updating, and deleting resources."),
-        Question(17, "single", "Which tool provides cost management and billing information?",
-                ["Azure Monitor", "Azure Advisor", "Azure Cost Management", "Azure Policy"],
-                [2], "C", "Azure Cost Management provides tools to monitor, allocate, and optimize cloud costs."),
-        Question(18, "single", "What is the purpose of Azure Tags?",
-                ["Security configuration", "Resource organization and cost tracking", "Performance monitoring", "Network routing"],
-                [1], "B", "Tags help organize resources and track costs across different departments or projects."),
-        
-        # Advanced Administration Questions
-        Question(19, "single", "What is Azure Automation used for?",
-                ["Manual resource management", "Automating repetitive tasks", "User authentication", "Data storage"],
-                [1], "B", "Azure Automation provides process automation, configuration management, and update management."),
-        Question(20, "single", "Which Azure service provides configuration management for VMs?",
-                ["Azure Monitor", "Azure Automation State Configuration", "Azure Backup", "Azure Security Center"],
-                [1], "B", "Azure Automation State Configuration ensures VMs maintain desired configuration state.")
-    ]
+    # Storage Management Questions
+    Question(4, "single", "Which storage account type provides the lowest cost for infrequently accessed data?",
+            ("Premium SSD", "Standard HDD", "Cool storage tier", "Archive storage tier"),
+            (3,), "Archive tier offers the lowest storage costs for rarely accessed data."),
+    Question(5, "single", "What is Azure Disk Encryption used for?",
+            ("Network traffic encryption", "VM disk encryption at rest", "Database encryption", "Application-level encryption"),
+            (1,), "Azure Disk Encryption encrypts VM disks using BitLocker or DM-Crypt."),
+    Question(6, "multiple", "Which Azure storage replication options are available? (Select all that apply)",
+            ("Locally redundant storage (LRS)", "Zone-redundant storage (ZRS)", "Geo-redundant storage (GRS)", "Read-access geo-redundant storage (RA-GRS)"),
+            (0, 1, 2, 3), "Azure provides multiple replication options for different durability needs."),
     
-    # Use variation seed to determine which questions to prioritize
-    import random
-    # Use local random instance to avoid affecting global state
-    local_random = random.Random(variation_seed)
+    # Identity & Access Questions
+    Question(7, "single", "What is Role-Based Access Control (RBAC) used for?",
+            ("Network traffic control", "Managing user permissions and access", "Data encryption", "Performance monitoring"),
+            (1,), "RBAC provides fine-grained access management for Azure resources."),
+    Question(8, "multiple", "Which built-in RBAC roles are commonly used? (Select all that apply)",
+            ("Owner", "Contributor", "Reader", "User Access Administrator"),
+            (0, 1, 2, 3), "These are fundamental built-in roles for Azure resource management."),
+    Question(9, "single", "What is Azure AD Connect used for?",
+            ("Connecting to on-premises Active Directory", "Managing Azure subscriptions", "Configuring network connections", "Monitoring application performance"),
+            (0,), "Azure AD Connect synchronizes on-premises AD with Azure AD."),
     
-    # Shuffle the questions based on the seed for variation
-    shuffled_questions = all_questions.copy()
-    local_random.shuffle(shuffled_questions)
+    # Networking Questions
+    Question(10, "single", "What is the purpose of Network Security Groups (NSGs)?",
+            ("Load balancing traffic", "Filtering network traffic with security rules", "Managing DNS resolution", "Providing VPN connectivity"),
+            (1,), "NSGs contain security rules that allow or deny network traffic."),
+    Question(11, "single", "Which service provides name resolution for Azure resources?",
+            ("Azure Traffic Manager", "Azure DNS", "Azure Load Balancer", "Azure Application Gateway"),
+            (1,), "Azure DNS provides name resolution using Microsoft's global network."),
+    Question(12, "single", "What is VNet peering used for?",
+            ("Connecting VNets in the same or different regions", "Creating VPN connections", "Managing network security", "Load balancing traffic"),
+            (0,), "VNet peering connects virtual networks for resource communication."),
     
-    return shuffled_questions
+    # Monitoring & Backup Questions
+    Question(13, "single", "Which service provides monitoring and alerting for Azure resources?",
+            ("Azure Security Center", "Azure Monitor", "Azure Advisor", "Azure Policy"),
+            (1,), "Azure Monitor collects and analyzes telemetry from cloud and on-premises environments."),
+    Question(14, "single", "What is Azure Backup used for?",
+            ("Network security", "Data protection and recovery", "Performance optimization", "Cost management"),
+            (1,), "Azure Backup provides backup and restore capabilities for Azure resources."),
+    Question(15, "multiple", "Which Azure services can be backed up using Azure Backup? (Select all that apply)",
+            ("Azure Virtual Machines", "Azure SQL Database", "Azure Files", "On-premises servers"),
+            (0, 1, 2, 3), "Azure Backup supports various Azure services and on-premises resources."),
+    
+    # Resource Management Questions
+    Question(16, "single", "What is Azure Resource Manager used for?",
+            ("Managing user identities", "Deploying and managing Azure resources", "Monitoring applications", "Configuring networks"),
+            (1,), "Azure Resource Manager provides a management layer for creating, updating, and deleting resources."),
+    Question(17, "single", "Which tool provides cost management and billing information?",
+            ("Azure Monitor", "Azure Advisor", "Azure Cost Management", "Azure Policy"),
+            (2,), "Azure Cost Management provides tools to monitor, allocate, and optimize cloud costs."),
+    Question(18, "single", "What is the purpose of Azure Tags?",
+            ("Security configuration", "Resource organization and cost tracking", "Performance monitoring", "Network routing"),
+            (1,), "Tags help organize resources and track costs across different departments or projects."),
+    
+    # Advanced Administration Questions
+    Question(19, "single", "What is Azure Automation used for?",
+            ("Manual resource management", "Automating repetitive tasks", "User authentication", "Data storage"),
+            (1,), "Azure Automation provides process automation, configuration management, and update management."),
+    Question(20, "single", "Which Azure service provides configuration management for VMs?",
+            ("Azure Monitor", "Azure Automation State Configuration", "Azure Backup", "Azure Security Center"),
+            (1,), "Azure Automation State Configuration ensures VMs maintain desired configuration state.")
+)
+
 
+@lru_cache(maxsize=_VARIATION_COUNT)
+def _get_az104_questions(variation_seed: int) -> Tuple[Question, ...]:
+    """Get AZ-104 specific questions based on variation (shuffled on first use)."""
+    return _shuffled_pool(_AZ104_POOL, variation_seed % _VARIATION_COUNT)
 
-def _get_general_azure_questions(variation_seed: int) -> List[Question]:
+
+# General Azure question pools, one picked per variation
+_GENERAL_POOLS = (
+    (  # Pool 0: Basic Azure Services
+        Question(1, "single", "What is Microsoft Azure?",
+                ("A cloud computing platform", "A database management system", "An operating system", "A programming language"),
+                (0,), "Microsoft Azure is a comprehensive cloud computing platform and service."),
+        Question(2, "single", "Which Azure service provides web application hosting?",
+                ("Azure Virtual Machines", "Azure App Service", "Azure Storage", "Azure SQL Database"),
+                (1,), "Azure App Service provides a platform for hosting web applications and APIs."),
+        Question(3, "single", "What is Azure Storage used for?",
+                ("Computing resources", "Data storage and management", "Network configuration", "User authentication"),
+                (1,), "Azure Storage provides scalable cloud storage for various data types.")
+    ),
+    (  # Pool 1: Cloud Concepts
+        Question(1, "single", "What is the main benefit of cloud computing?",
+                ("Fixed costs", "On-demand scalability", "Local data storage", "Offline access"),
+                (1,), "Cloud computing provides on-demand scalability and flexibility."),
+        Question(2, "multiple", "Which are characteristics of cloud computing? (Select all that apply)",
+                ("On-demand self-service", "Broad network access", "Resource pooling", "Rapid elasticity"),
+                (0, 1, 2, 3), "These are the essential characteristics of cloud computing."),
+        Question(3, "single", "What is Infrastructure as a Service (IaaS)?",
+                ("Software applications", "Development platforms", "Computing infrastructure", "Business processes"),
+                (2,), "IaaS provides virtualized computing infrastructure over the internet.")
+    )
+)
+
+
+def _get_general_azure_questions(variation_seed: int) -> Tuple[Question, ...]:
     """Get general Azure questions for other exam types."""
-    
-    question_pools = [
-        [  # Pool 0: Basic Azure Services
-            Question(1, "single", "What is Microsoft Azure?",
-                    ["A cloud computing platform", "A database management system", "An operating system", "A programming language"],
-                    [0], "A", "Microsoft Azure is a comprehensive cloud computing platform and service."),
-            Question(2, "single", "Which Azure service provides web application hosting?",
-                    ["Azure Virtual Machines", "Azure App Service", "Azure Storage", "Azure SQL Database"],
-                    [1], "B", "Azure App Service provides a platform for hosting web applications and APIs."),
-            Question(3, "single", "What is Azure Storage used for?",
-                    ["Computing resources", "Data storage and management", "Network configuration", "User authentication"],
-                    [1], "B", "Azure Storage provides scalable cloud storage for various data types.")
-        ],
-        [  # Pool 1: Cloud Concepts
-            Question(1, "single", "What is the main benefit of cloud computing?",
-                    ["Fixed costs", "On-demand scalability", "Local data storage", "Offline access"],
-                    [1], "B", "Cloud computing provides on-demand scalability and flexibility."),
-            Question(2, "multiple", "Which are characteristics of cloud computing? (Select all that apply)",
-                    ["On-demand self-service", "Broad network access", "Resource pooling", "Rapid elasticity"],
-                    [0, 1, 2, 3], "A,B,C,D", "These are the essential characteristics of cloud computing."),
-            Question(3, "single", "What is Infrastructure as a Service (IaaS)?",
-                    ["Software applications", "Development platforms", "Computing infrastructure", "Business processes"],
-                    [2], "C", "IaaS provides virtualized computing infrastructure over the internet.")
-        ]
-    ]
-    
-    return question_pools[variation_seed % len(question_pools)]
+    return _GENERAL_POOLS[variation_seed % len(_GENERAL_POOLS)]
 
 
 # For backward compatibility
@@ -339,6 +399,11 @@ def parse_simple_text_format(file_path: str) -> Exam:
 
 
 if __name__ == "__main__":
+    import sys
+
+    # Show the parser's debug diagnostics when run by hand
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     # Test with different files
     test_files = [
         "vce/Designing Microsoft Azure Infrastructure Solutions.AZ-305.Test4Prep.2025-02-22.35q.vce",
@@ -346,12 +411,29 @@ if __name__ == "__main__":
         "vce/Microsoft.actualtests.AZ-104.v2025-02-16.by.ida.206q.vce"
     ]
     
+    # Optional deterministic profile of the parse path (view with snakeviz/pstats)
+    profiler = None
+    if "--profile" in sys.argv:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    
+    # Collect the report and write it once instead of one print per line
+    report: List[str] = []
     for file_path in test_files:
+        name = Path(file_path).name
         try:
             exam = parse_vce_file(file_path)
-            print(f"\n✅ {Path(file_path).name}")
-            print(f"   Title: {exam.title}")
-            print(f"   Questions: {exam.total_questions}")
-            print(f"   First Q: {exam.questions[0].question_text[:60]}...")
+            report.append(f"\n✅ {name}")
+            report.append(f"   Title: {exam.title}")
+            report.append(f"   Questions: {exam.total_questions}")
+            report.append(f"   First Q: {exam.questions[0].question_text[:60]}...")
         except Exception as e:
-            print(f"\n❌ {Path(file_path).name}: {e}")
\ No newline at end of file
+            report.append(f"\n❌ {name}: {e}")
+    
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats("vce_parser.prof")
+        report.append("\nProfile written to vce_parser.prof")
+    
+    sys.stdout.write("\n".join(report) + "\n")
\ No newline at end of file